@@ -6,7 +6,7 @@ A simple, production-ready-ish Python script that fetches top stories from a set
 then sends it via SMTP (e.g., Gmail with an app password).
 
 Quick start:
-1) pip install -r requirements.txt  (feedparser, python-dateutil)
+1) pip install -r requirements.txt  (feedparser, aiohttp; lxml and python-dateutil optional)
 2) Set environment variables (or make a .env and load them yourself):
    - SMTP_HOST (e.g., "smtp.gmail.com")
    - SMTP_PORT (e.g., 465 for SSL, or 587 for STARTTLS)
@@ -20,6 +20,8 @@ Notes:
 - Use Gmail App Passwords (recommended) if using Gmail.
 - You can change FEEDS below to whatever you like.
 - Schedule with cron/Task Scheduler for daily digests.
+- Feeds are fetched with ETag/Last-Modified validators cached in ~/.email_news_cache.json,
+  so unchanged feeds are neither re-downloaded nor re-parsed.
 """
 
 from __future__ import annotations
@@ -29,24 +31,40 @@ import ssl
 import sys
 import smtplib
 import html
+import hashlib
+import json
 import time
 import argparse
+import asyncio
 import logging
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.utils import parsedate_to_datetime
+from email.message import EmailMessage
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Tuple
+from io import BytesIO
+from operator import itemgetter
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import List, Dict, Any, Tuple, Optional, Iterable
 
 try:
     import feedparser  # type: ignore
 except Exception as e:
-    print("Missing dependency 'feedparser'. Install with: pip install feedparser python-dateutil", file=sys.stderr)
+    print("Missing dependency 'feedparser'. Install with: pip install feedparser", file=sys.stderr)
     raise
 
 try:
-    from dateutil import parser as dateparser  # type: ignore
+    from dateutil import parser as dateparser  # type: ignore  # optional: last-resort date parsing
 except Exception:
-    print("Missing dependency 'python-dateutil'. Install with: pip install python-dateutil", file=sys.stderr)
+    dateparser = None
+
+try:
+    from lxml import etree  # type: ignore  # optional: fast path for well-formed RSS/Atom
+except Exception:
+    etree = None
+
+try:
+    import aiohttp  # type: ignore
+except Exception:
+    print("Missing dependency 'aiohttp'. Install with: pip install aiohttp", file=sys.stderr)
     raise
 
 # ---------------------- Config ----------------------
@@ -56,6 +74,58 @@ DEFAULT_FEEDS = [
     ("Hacker News", "https://hnrss.org/frontpage"),
 ]
 
+FETCH_TIMEOUT = 15      # seconds per feed download attempt
+CONNECT_TIMEOUT = 5     # seconds to establish the connection
+FETCH_RETRIES = 3       # attempts per feed, with exponential backoff (1s, 2s, ...)
+USER_AGENT = "email_news_app/1.0"
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+MAX_CONCURRENCY = 8     # simultaneous feed downloads
+CACHE_PATH = os.path.expanduser("~/.email_news_cache.json")  # ETag/Last-Modified + parsed items per feed URL
+
+# Precompiled extractors for the lxml fast path, keyed by entry tag. Each field
+# is a tuple of XPaths tried in order: (title, link, date, summary).
+if etree is not None:
+    _XNS = {"a": ATOM_NS[1:-1], "dc": "http://purl.org/dc/elements/1.1/"}
+    _XPATHS = {
+        "item": (  # RSS 2.0
+            (etree.XPath("string(title)"),),
+            (etree.XPath("string(link)"), etree.XPath("string(guid)")),
+            (etree.XPath("string(pubDate)"), etree.XPath("string(dc:date)", namespaces=_XNS)),
+            (etree.XPath("string(description)"),),
+        ),
+        ATOM_NS + "entry": (
+            (etree.XPath("string(a:title)", namespaces=_XNS),),
+            (etree.XPath("string(a:link[not(@rel) or @rel='alternate'][1]/@href)", namespaces=_XNS),
+             etree.XPath("string(a:id)", namespaces=_XNS)),
+            (etree.XPath("string(a:published)", namespaces=_XNS), etree.XPath("string(a:updated)", namespaces=_XNS)),
+            (etree.XPath("string(a:summary)", namespaces=_XNS),),
+        ),
+    }
+
+# HTML digest: static CSS lives once in <style>, items are filled into a single template
+_HTML_HEAD = (
+    "<html><head><style>"
+    "body{font-family:system-ui,-apple-system,Segoe UI,Roboto,Arial;line-height:1.5}"
+    "h2{margin:0 0 12px}.lead{color:#555;margin:0 0 16px}ol{padding-left:20px}"
+    ".i{margin-bottom:12px}.t{font-weight:600}.m{color:#666;font-size:13px}"
+    "hr{border:none;border-top:1px solid #eee;margin:16px 0}.f{color:#777;font-size:12px}"
+    "</style></head><body>\n"
+    "<h2>Your News Digest</h2>\n"
+    '<p class="lead">Top updates from your selected feeds.</p>\n'
+    "<ol>\n"
+)
+_ITEM_TMPL = (
+    '<li class="i"><div class="t"><a href="{link}" target="_blank" rel="noopener noreferrer">{title}</a></div>'
+    '<div class="m">{source} • {ts}</div></li>\n'
+)
+_HREF_SAFE = str.maketrans({'"': "&quot;", "&": "&amp;"})  # all an href="..." value needs
+_HTML_EMPTY = "<li>No new items found for the selected time window.</li>\n"
+_HTML_TAIL = (
+    "</ol>\n<hr/>\n"
+    '<div class="f">You received this digest because you (or a script) ran email_news_app.py.</div>\n'
+    "</body></html>\n"
+)
+
 # Set sane logging defaults
 logging.basicConfig(
     level=logging.INFO,
@@ -94,22 +164,118 @@ def load_env() -> Dict[str, str]:
     return env
 
 
-def fetch_feed(title: str, url: str) -> Tuple[str, List[Dict[str, Any]]]:
-    """Fetch and parse a single RSS/Atom feed. Returns (title, entries)."""
-    logger.info("Fetching feed: %s", url)
-    fp = feedparser.parse(url)
+def load_cache() -> Dict[str, Dict[str, Any]]:
+    """Load the per-feed HTTP validator/items cache. Returns {} if missing or unreadable."""
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    try:
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as exc:
+        logger.warning("Could not write feed cache %s: %s", CACHE_PATH, exc)
+
+
+def items_to_cache(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Make parsed items JSON-serialisable (datetimes -> ISO strings)."""
+    return [{**it, "published": it["published"].isoformat() if it["published"] else None} for it in items]
+
+
+def items_from_cache(items: List[Dict[str, Any]], source: str) -> List[Dict[str, Any]]:
+    """Rebuild cached items, labelled with the caller's current feed title (the cache is keyed by URL only)."""
+    return [{**it, "source": source, "published": datetime.fromisoformat(it["published"]) if it["published"] else None}
+            for it in items]
+
+
+async def fetch_body(session: aiohttp.ClientSession, sem: asyncio.Semaphore, url: str,
+                     cached: Dict[str, Any]) -> Tuple[int, Optional[bytes], Optional[str], Optional[str]]:
+    """Conditionally download a single feed using the cached ETag/Last-Modified.
+
+    Returns (status, body, etag, modified); status is 0 on failure and 304 when
+    the feed is unchanged (body is then None).
+    """
+    headers = {"User-Agent": USER_AGENT}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+    for attempt in range(FETCH_RETRIES):
+        try:
+            # Hold a concurrency slot only for the request itself, not the backoff
+            async with sem:
+                logger.info("Fetching feed: %s", url)
+                async with session.get(url, headers=headers) as resp:
+                    if resp.status == 304:
+                        return 304, None, cached.get("etag"), cached.get("modified")
+                    resp.raise_for_status()
+                    body = await resp.read()
+                    return resp.status, body, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientResponseError) as exc:
+            # Timeouts, connection errors and 5xx are transient: back off and
+            # retry so one slow feed costs at most FETCH_RETRIES * FETCH_TIMEOUT
+            # (+ backoff). Other HTTP errors (4xx) will not get better.
+            if isinstance(exc, aiohttp.ClientResponseError) and exc.status < 500:
+                logger.warning("Failed to fetch %s: %s", url, exc)
+                break
+            if attempt + 1 < FETCH_RETRIES:
+                logger.info("Retrying %s after error: %r", url, exc)
+                await asyncio.sleep(2 ** attempt)
+                continue
+            logger.warning("Failed to fetch %s: %r", url, exc)
+        except Exception as exc:
+            logger.warning("Failed to fetch %s: %s", url, exc)
+            break
+    return 0, None, None, None
+
+
+def _fast_parse(s: str) -> Optional[datetime]:
+    """Parse an RSS (RFC 822) or Atom (ISO 8601) date, using dateutil only as a last resort."""
+    try:
+        return parsedate_to_datetime(s)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    if dateparser is not None:
+        try:
+            return dateparser.parse(s)
+        except Exception:
+            pass
+    return None
+
+
+def entry_date(e: Any) -> Optional[datetime]:
+    """Best-effort published date for a feedparser entry."""
+    # Try multiple date fields; feedparser's *_parsed struct_time is already UTC
+    for key in ("published", "updated", "created"):
+        parsed = e.get(key + "_parsed")
+        if parsed:
+            return datetime(*parsed[:6], tzinfo=timezone.utc)
+        if key in e:
+            published = _fast_parse(str(e[key]))
+            if published is not None:
+                return published
+    return None
+
+
+def fetch_feed(title: str, url: str, body: bytes) -> Tuple[str, List[Dict[str, Any]]]:
+    """Parse a single downloaded RSS/Atom feed. Returns (title, entries)."""
+    fp = feedparser.parse(body)
     feed_title = title or fp.feed.get("title", url)
+    UTC = timezone.utc
     items = []
     for e in fp.entries:
-        published = None
-        # Try multiple date fields
-        for key in ("published", "updated", "created"):
-            if key in e:
-                try:
-                    published = dateparser.parse(str(e[key]))
-                    break
-                except Exception:
-                    continue
+        published = entry_date(e)
+        if published is not None and published.tzinfo is None:
+            # make naïve datetimes timezone-aware as UTC
+            published = published.replace(tzinfo=UTC)
         link = e.get("link") or e.get("id") or ""
         items.append({
             "source": feed_title,
@@ -117,32 +283,125 @@ def fetch_feed(title: str, url: str) -> Tuple[str, List[Dict[str, Any]]]:
             "summary": e.get("summary", ""),
             "link": link,
             "published": published,
+            "undated": published is None,
         })
     return feed_title, items
 
 
-def harvest_all(feeds: List[Tuple[str, str]], per_feed: int, since_hours: int, max_total: int) -> List[Dict[str, Any]]:
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=since_hours)
+def _first(el: Any, paths: Tuple[Any, ...]) -> str:
+    for xp in paths:
+        value = xp(el).strip()
+        if value:
+            return value
+    return ""
+
+
+def fetch_feed_fast(title: str, url: str, body: bytes) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+    """Parse a well-formed RSS 2.0/Atom feed with lxml. Returns None if unsupported so callers can fall back."""
+    if etree is None:
+        return None
+    feed_title = title or url
+    UTC = timezone.utc
+    items = []
+    try:
+        for _, el in etree.iterparse(BytesIO(body), events=("end",), tag=tuple(_XPATHS),
+                                     resolve_entities=False, no_network=True):
+            title_x, link_x, date_x, summary_x = _XPATHS[el.tag]
+            date_s = _first(el, date_x)
+            published = _fast_parse(date_s) if date_s else None
+            if published is not None and published.tzinfo is None:
+                published = published.replace(tzinfo=UTC)
+            items.append({
+                "source": feed_title,
+                "title": _first(el, title_x) or "(No title)",
+                "summary": _first(el, summary_x),
+                "link": _first(el, link_x),
+                "published": published,
+                "undated": published is None,
+            })
+            # Free parsed elements as we go to bound memory on large feeds
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+    except etree.LxmlError as exc:
+        logger.info("Fast parse failed for %s (%s), falling back to feedparser", url, exc)
+        return None
+    if not items:
+        return None
+    return feed_title, items
+
+
+def _canon(url: str) -> str:
+    """Canonical form of a link for de-duplication (drops tracking params, fragment, trailing slash)."""
+    try:
+        s = urlsplit(url)
+        q = [kv for kv in parse_qsl(s.query, keep_blank_values=True) if not kv[0].startswith(("utm_", "fbclid"))]
+        return urlunsplit((s.scheme.lower(), s.netloc.lower(), s.path.rstrip("/"), urlencode(q), ""))
+    except ValueError:
+        # Malformed links (e.g. "http://[bad/") just dedup on the raw string
+        return url
+
+
+def resolve_feed(title: str, url: str, fetched: Tuple[int, Optional[bytes], Optional[str], Optional[str]],
+                 cache: Dict[str, Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+    """Turn a fetch result into (title, entries), reusing cached items on 304 or identical content."""
+    status, body, etag, modified = fetched
+    cached = cache.get(url, {})
+    if status == 304 and "items" in cached:
+        logger.info("Feed not modified: %s", url)
+        feed_title = title or cached.get("title", url)
+        return feed_title, items_from_cache(cached["items"], feed_title)
+    if body is None:
+        return title or url, []
+    # Servers without validator support still often return identical XML;
+    # skip the parse when the body hash matches what we parsed last time.
+    digest = hashlib.sha256(body).hexdigest()
+    if cached.get("hash") == digest and "items" in cached:
+        logger.info("Feed content unchanged: %s", url)
+        cached.update(etag=etag, modified=modified)
+        feed_title = title or cached.get("title", url)
+        return feed_title, items_from_cache(cached["items"], feed_title)
+    feed_title, items = fetch_feed_fast(title, url, body) or fetch_feed(title, url, body)
+    cache[url] = {"etag": etag, "modified": modified, "hash": digest, "title": feed_title,
+                  "items": items_to_cache(items)}
+    return feed_title, items
+
+
+async def harvest_all_async(feeds: List[Tuple[str, str]], per_feed: int, since_hours: int, max_total: int) -> List[Dict[str, Any]]:
+    UTC = timezone.utc
+    now_utc = datetime.now(UTC)
+    cutoff = now_utc - timedelta(hours=since_hours)
     all_items: List[Dict[str, Any]] = []
     seen_links = set()
 
-    for title, url in feeds:
-        feed_title, items = fetch_feed(title, url)
-        # Sort by published desc (fallback to now for None)
-        items.sort(key=lambda x: x["published"] or datetime.now(timezone.utc), reverse=True)
+    # Download all feeds concurrently on one event loop; parsing stays
+    # synchronous and runs in feed order so the max_total cut-off is stable.
+    cache = load_cache()
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT, sock_connect=CONNECT_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        fetched = await asyncio.gather(*[fetch_body(session, sem, url, cache.get(url, {})) for _, url in feeds])
+    results = [resolve_feed(title, url, f, cache) for (title, url), f in zip(feeds, fetched)]
+    save_cache(cache)
+
+    for feed_title, items in results:
+        # Undated items count as published now (always inside the window) so
+        # every item has an aware datetime and the sorts need no fallback.
+        for it in items:
+            if it["published"] is None:
+                it["published"] = now_utc
+        # Sort by published desc
+        items.sort(key=itemgetter("published"), reverse=True)
         count = 0
         for it in items:
             if count >= per_feed:
                 break
-            if it["published"] and it["published"].tzinfo is None:
-                # make naïve datetimes timezone-aware as UTC
-                it["published"] = it["published"].replace(tzinfo=timezone.utc)
-            if it["published"] and it["published"] < cutoff:
+            if it["published"] < cutoff:
                 continue
-            link = it.get("link", "")
-            if link in seen_links:
+            key = _canon(it.get("link", ""))
+            if key in seen_links:
                 continue
-            seen_links.add(link)
+            seen_links.add(key)
             all_items.append(it)
             count += 1
             if len(all_items) >= max_total:
@@ -150,96 +409,147 @@ def harvest_all(feeds: List[Tuple[str, str]], per_feed: int, since_hours: int, m
         if len(all_items) >= max_total:
             break
 
-    # Final global sort
-    all_items.sort(key=lambda x: x["published"] or datetime.now(timezone.utc), reverse=True)
+    # Final global sort; format the display timestamp once for both renderers
+    all_items.sort(key=itemgetter("published"), reverse=True)
+    for it in all_items:
+        # astimezone() with no argument applies the local zone's DST rules per item
+        it["ts"] = "" if it.get("undated") else it["published"].astimezone().strftime("%Y-%m-%d %H:%M")
     return all_items
 
 
-def render_plain(items: List[Dict[str, Any]]) -> str:
+def render_both(items: List[Dict[str, Any]]) -> Tuple[str, str]:
+    """Render the digest as (plain text, HTML) in a single pass over items."""
+    esc = html.escape
+    href_safe = _HREF_SAFE
+
     lines = []
+    parts = []
     for i, it in enumerate(items, 1):
-        ts = it["published"].astimezone().strftime("%Y-%m-%d %H:%M") if it.get("published") else ""
-        lines.append(f"{i}. {it['title']}\n   {it['source']} | {ts}\n   {it['link']}\n")
-    if not lines:
-        lines = ["No new items found for the selected time window."]
-    return "\n".join(lines)
-
-
-def render_html(items: List[Dict[str, Any]]) -> str:
-    def esc(s: str) -> str:
-        return html.escape(s or "")
-
-    parts = [
-        """
-        <html>
-          <body style="font-family: system-ui, -apple-system, Segoe UI, Roboto, Arial; line-height:1.5;">
-            <h2 style="margin:0 0 12px;">Your News Digest</h2>
-            <p style="color:#555; margin:0 0 16px;">Top updates from your selected feeds.</p>
-            <ol style="padding-left:20px;">
-        """
-    ]
+        title, source, link, ts = it["title"], it["source"], it.get("link", ""), it["ts"]
+        lines.append(f"{i}. {title}\n   {source} | {ts}\n   {link}\n")
+        # ts is strftime output (digits, '-', ':') or empty, so it needs no escaping
+        parts.append(_ITEM_TMPL.format(link=link.translate(href_safe), title=esc(title), source=esc(source), ts=ts))
     if not items:
-        parts.append("<li>No new items found for the selected time window.</li>")
-    for it in items:
-        ts = it["published"].astimezone().strftime("%Y-%m-%d %H:%M") if it.get("published") else ""
-        parts.append(
-            f"""
-            <li style=\"margin-bottom:12px;\">
-              <div style=\"font-weight:600;\"><a href=\"{esc(it.get('link',''))}\" target=\"_blank\" rel=\"noopener noreferrer\">{esc(it['title'])}</a></div>
-              <div style=\"color:#666; font-size:13px;\">{esc(it['source'])} • {esc(ts)}</div>
-            </li>
-            """
-        )
-    parts.append("""
-            </ol>
-            <hr style="border:none; border-top:1px solid #eee; margin:16px 0;"/>
-            <div style="color:#777; font-size:12px;">You received this digest because you (or a script) ran email_news_app.py.</div>
-          </body>
-        </html>
-    """)
-    return "".join(parts)
-
-
-def build_message(subject: str, from_email: str, to_emails: List[str], plain: str, html_body: str | None) -> MIMEMultipart:
-    msg = MIMEMultipart("alternative")
+        lines.append("No new items found for the selected time window.")
+        parts.append(_HTML_EMPTY)
+    return "\n".join(lines), _HTML_HEAD + "".join(parts) + _HTML_TAIL
+
+
+def _body_cte(text: str) -> Optional[str]:
+    """Transfer encoding for a text body: 7bit/8bit if no line exceeds 998 octets, else None (let email pick)."""
+    if any(len(line.encode("utf-8")) > 998 for line in text.splitlines()):
+        return None
+    return "7bit" if text.isascii() else "8bit"
+
+
+def build_message(subject: str, from_email: str, to_emails: List[str], plain: str, html_body: str | None) -> EmailMessage:
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = from_email
     msg["To"] = ", ".join(to_emails)
 
-    part1 = MIMEText(plain, "plain", "utf-8")
-    msg.attach(part1)
+    # Bodies go out unencoded (7bit/8bit) whenever every line fits the SMTP
+    # 998-octet limit; SmtpSession.send re-encodes 8bit parts if the server
+    # lacks 8BITMIME. Longer lines are left to the content manager (QP/base64).
+    msg.set_content(plain, cte=_body_cte(plain))
 
     if html_body:
-        part2 = MIMEText(html_body, "html", "utf-8")
-        msg.attach(part2)
+        msg.add_alternative(html_body, subtype="html", cte=_body_cte(html_body))
+        for part in msg.iter_parts():
+            del part["MIME-Version"]  # set_content adds it; only the top level should carry it
     return msg
 
 
-def send_email(env: Dict[str, str], msg: MIMEMultipart) -> None:
-    host = env.get("SMTP_HOST")
-    port_s = env.get("SMTP_PORT")
-    user = env.get("SMTP_USERNAME")
-    pwd = env.get("SMTP_PASSWORD")
+def downgrade_8bit(msg: EmailMessage) -> None:
+    """Re-encode any 8bit body parts as base64 for servers without 8BITMIME."""
+    for part in msg.walk():
+        if not part.is_multipart() and part.get("Content-Transfer-Encoding") == "8bit":
+            part.set_content(part.get_content(), subtype=part.get_content_subtype(), cte="base64")
+            if part is not msg:
+                del part["MIME-Version"]  # set_content adds it; only the top level should carry it
+
+
+class SmtpSession:
+    """A reusable SMTP connection: connect/TLS/AUTH once, send many messages.
+
+    Reconnects transparently if the server drops the connection, and
+    keepalive() can be called between runs when used from a long-lived process.
+    """
+
+    def __init__(self, env: Dict[str, str]) -> None:
+        host = env.get("SMTP_HOST")
+        port_s = env.get("SMTP_PORT")
+        user = env.get("SMTP_USERNAME")
+        pwd = env.get("SMTP_PASSWORD")
+
+        if not (host and port_s and user and pwd):
+            raise RuntimeError("SMTP_HOST/SMTP_PORT/SMTP_USERNAME/SMTP_PASSWORD must be set.")
+
+        self.host = host
+        self.port = int(port_s)
+        self.user = user
+        self.pwd = pwd
+        self.server: Optional[smtplib.SMTP] = None
+
+    def connect(self) -> smtplib.SMTP:
+        # SSL (implicit) if port is 465, otherwise STARTTLS
+        if self.port == 465:
+            server: smtplib.SMTP = smtplib.SMTP_SSL(self.host, self.port, context=ssl.create_default_context())
+        else:
+            server = smtplib.SMTP(self.host, self.port)
+            if self.port == 587:
+                server.starttls(context=ssl.create_default_context())
+        server.ehlo()
+        server.login(self.user, self.pwd)
+        self.server = server
+        return server
+
+    def send(self, msg: EmailMessage) -> None:
+        server = self.server or self.connect()
+        try:
+            self._send(server, msg)
+        except smtplib.SMTPServerDisconnected:
+            logger.info("SMTP connection dropped, reconnecting")
+            self._send(self.connect(), msg)
+
+    @staticmethod
+    def _send(server: smtplib.SMTP, msg: EmailMessage) -> None:
+        if server.has_extn("8bitmime"):
+            server.send_message(msg, mail_options=["BODY=8BITMIME"])
+        else:
+            downgrade_8bit(msg)
+            server.send_message(msg)
 
-    if not (host and port_s and user and pwd):
-        raise RuntimeError("SMTP_HOST/SMTP_PORT/SMTP_USERNAME/SMTP_PASSWORD must be set.")
+    def keepalive(self) -> None:
+        """Issue NOOP so an idle connection is not timed out; forget it if it is already gone."""
+        if self.server is None:
+            return
+        try:
+            self.server.noop()
+        except smtplib.SMTPException:
+            self.server = None
 
-    port = int(port_s)
+    def close(self) -> None:
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            pass
+        self.server = None
 
-    # SSL (implicit) if port is 465, otherwise STARTTLS
-    if port == 465:
-        context = ssl.create_default_context()
-        with smtplib.SMTP_SSL(host, port, context=context) as server:
-            server.login(user, pwd)
-            server.send_message(msg)
-    else:
-        with smtplib.SMTP(host, port) as server:
-            server.ehlo()
-            if port == 587:
-                server.starttls(context=ssl.create_default_context())
-                server.ehlo()
-            server.login(user, pwd)
-            server.send_message(msg)
+    def __enter__(self) -> "SmtpSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def send_email(env: Dict[str, str], msgs: Iterable[EmailMessage]) -> None:
+    """Send all messages over a single SMTP connection."""
+    with SmtpSession(env) as session:
+        for msg in msgs:
+            session.send(msg)
 
 
 # ---------------------- Main ----------------------
@@ -254,15 +564,16 @@ def main():
     else:
         feeds = DEFAULT_FEEDS
 
-    items = harvest_all(
+    items = asyncio.run(harvest_all_async(
         feeds=feeds,
         per_feed=args.per_feed,
         since_hours=args.since,
         max_total=args.max,
-    )
+    ))
 
-    plain = render_plain(items)
-    html_body = None if args.no_html else render_html(items)
+    plain, html_body = render_both(items)
+    if args.no_html:
+        html_body = None
 
     to_emails = [e.strip() for e in env.get("TO_EMAIL", "").split(",") if e.strip()]
 
@@ -289,7 +600,7 @@ def main():
         html_body=html_body,
     )
 
-    send_email(env, msg)
+    send_email(env, [msg])
     logger.info("Digest sent to: %s", ", ".join(to_emails))
 
 
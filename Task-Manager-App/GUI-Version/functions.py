@@ -1,3 +1,5 @@
+import threading
+
 FILE_PATH = r"C:\Users\sambh\OneDrive\Desktop\Python code\20-Python-Projects\Task-Manager-App\GUI-Version\todos.txt" #file apth
 
 
@@ -10,4 +12,24 @@ def readFile():
 def writeFile(todos):
     with open(FILE_PATH, 'w') as file:#Start overwritting that file
         file.writelines(todos)#Rewrite the whole file with new input in it
-    
\ No newline at end of file
+
+
+_pending_write = None #debounce timer for scheduleWrite
+
+
+def scheduleWrite(todos, delay=2.0):
+    global _pending_write
+    if _pending_write is not None:#a newer change supersedes the queued write
+        _pending_write.cancel()
+    _pending_write = threading.Timer(delay, writeFile, args=[list(todos)])#write a snapshot once edits settle
+    _pending_write.daemon = True
+    _pending_write.start()
+
+
+def flushWrite(todos):
+    global _pending_write
+    if _pending_write is not None:#drop the queued write (or let a running one finish) before saving the latest list
+        _pending_write.cancel()
+        _pending_write.join()
+        _pending_write = None
+    writeFile(todos)
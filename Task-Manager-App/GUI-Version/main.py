@@ -1,11 +1,15 @@
+import atexit
 import FreeSimpleGUI as fsg
 import functions 
 
+todos = functions.readFile()#read once, then work on the in-memory list
+atexit.register(functions.flushWrite, todos)#save whatever is left on exit
+
 label = fsg.Text("Type in a To-Do")
 input_box = fsg.InputText(tooltip="Enter To-Do", key="todo")
 add_button = fsg.Button("Add")
 exit_button = fsg.Button("Exit")
-list_box = fsg.Listbox(values=functions.readFile(), key='todos', 
+list_box = fsg.Listbox(values=todos, key='todos', 
                        enable_events=True, size=[45, 10])
 edit_button = fsg.Button("Edit")
   
@@ -14,32 +18,36 @@ window = fsg.Window("My To Do App",
                             [exit_button], 
                             [list_box, edit_button]],
                     font=('Helvetica', 20))
+
+
+def add_todo(values):
+    new_todo = values['todo'] + '\n'
+    todos.append(new_todo)
+    functions.scheduleWrite(todos)
+    window["todos"].update(values=todos)
+
+
+def edit_todo(values):
+    new_todo = values['todo']
+    index = window['todos'].get_indexes()[0]#selected row, no need to search the list
+    todos[index] = new_todo
+    functions.scheduleWrite(todos)
+    window['todos'].update(values=todos)
+
+
+def select_todo(values):
+    window['todo'].update(value=values['todos'][0])
+
+
+HANDLERS = {"Add": add_todo, "Edit": edit_todo, "todos": select_todo}#event -> handler, one dict lookup per event
+
 while True:
     event, values = window.read()
 
-    if event == "Add":
-        todos = functions.readFile()
-        new_todo = values['todo'] + '\n'
-        todos.append(new_todo)
-        functions.writeFile(todos)
-        window["todos"].update(values=todos)
-
-    if event == "Edit":
-        todo_to_edit = values['todos'][0]
-        new_todo = values['todo']
-        todos = functions.readFile()
-        index = todos.index(todo_to_edit)
-        todos[index] = new_todo
-        functions.writeFile(todos)
-        window['todos'].update(values=todos)
-    
-    if event == 'todos':
-        window['todo'].update(value=values['todos'][0])
-
-
-    if event == "Exit":
+    if event in (fsg.WIN_CLOSED, "Exit"):
         break
 
-    if fsg.WIN_CLOSED:
-        break
-window.close()
\ No newline at end of file
+    handler = HANDLERS.get(event)
+    if handler:
+        handler(values)
+window.close()
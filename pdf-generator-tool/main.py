@@ -30,7 +30,7 @@ Install dependency first:
 import sys
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     from fpdf import FPDF  # pip install fpdf2
@@ -70,19 +70,45 @@ def read_text(input_path: Optional[Path], text_arg: Optional[str]) -> str:
         return sys.stdin.read()
     return ""
 
+def paragraphs(text: str) -> Iterator[str]:
+    """Lazily yield the blocks of content.split("\n\n"); empty blocks yield ""."""
+    start = 0
+    while True:
+        end = text.find("\n\n", start)
+        para = text[start:] if end == -1 else text[start:end]
+        yield "\n".join(para.splitlines())
+        if end == -1:
+            return
+        start = end + 2
+
+BATCH_LINES = 50  # source lines per multi_cell call
+
 def add_text_to_pdf(pdf: PDF, content: str, font_name: str, font_size: int, align: str):
     pdf.set_font(font_name, size=font_size)
-    # Split on double newlines for naive paragraph handling
-    paragraphs = content.split("\n\n")
-    for para in paragraphs:
-        lines = para.splitlines()
-        if not lines:
+    pdf.set_auto_page_break(True, margin=pdf.b_margin)
+
+    def flush(batch):
+        # One multi_cell per batch of paragraphs, separated by a blank line;
+        # end with the same full-line gap so spacing is even across batches
+        pdf.multi_cell(w=0, h=pdf.line_height, txt="\n\n".join(batch), align=align)
+        pdf.ln(pdf.line_height)
+
+    batch, batch_lines = [], 0
+    for block in paragraphs(content):
+        if not block:
+            # Extra blank runs keep their original single-line gap
+            if batch:
+                flush(batch)
+                batch, batch_lines = [], 0
             pdf.ln(pdf.line_height)
             continue
-        # Join back into a single paragraph with newline handling
-        block = "\n".join(lines)
-        pdf.multi_cell(w=0, h=pdf.line_height, txt=block, align=align)
-        pdf.ln(pdf.line_height / 2)
+        batch.append(block)
+        batch_lines += block.count("\n") + 1
+        if batch_lines >= BATCH_LINES:
+            flush(batch)
+            batch, batch_lines = [], 0
+    if batch:
+        flush(batch)
 
 def main():
     parser = argparse.ArgumentParser(description="Basic starter PDF generator using fpdf2.")